@@ -3,7 +3,20 @@ from .binance_api import BinanceAPI
 from .bybit_api import BybitAPI
 from .coinbase_api import CoinbaseAPI
 from .mock_api import MockAPI
-from .dashboard_api import app, run, run_flask_in_new_terminal, stop_flask
+
+# Flask is only needed when the dashboard is enabled, so dashboard_api is
+# imported on first access to one of its names.
+_DASHBOARD_EXPORTS = frozenset({'app', 'run', 'run_flask_in_new_terminal', 'stop_flask'})
+
+
+def __getattr__(name):
+    if name in _DASHBOARD_EXPORTS:
+        from . import dashboard_api
+        value = getattr(dashboard_api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BirzaAPI',
@@ -6,7 +6,7 @@ import time
 import pandas as pd
 import concurrent.futures
 from functools import lru_cache, partial
-from hashlib import md5
+from hashlib import blake2b
 import pickle
 import json
 from multiprocessing import cpu_count
@@ -21,6 +21,32 @@ from STRATEGY import BaseStrategy
 # Type variable for strategy classes
 T = TypeVar('T', bound=BaseStrategy)
 
+
+# Leaf types whose repr() is stable across runs
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert nested params into tagged, hashable tuples.
+
+    Containers are tagged so a dict, a list and a tuple never freeze alike.
+    Anything other than str-keyed dicts, lists, tuples and JSON scalars
+    raises TypeError.
+    """
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError("cache key dicts must have str keys")
+        return ('d', tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, list):
+        return ('l', tuple(_freeze(v) for v in value))
+    if isinstance(value, tuple):
+        return ('t', tuple(_freeze(v) for v in value))
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    raise TypeError(f"unsupported cache key value of type {type(value).__name__}")
+
+
 class Analytic:
     def __init__(self, df: pd.DataFrame, data_name: str, output_file: str = "anal.csv", 
                  cache_dir: str = "DATA/cache", create_cache_dir: bool = False) -> None:
@@ -118,6 +144,26 @@ class Analytic:
 
         return []
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_indicator_params(name: str) -> frozenset:
+        """
+        Get the parameter names accepted by an Indicators method.
+
+        Signatures are fixed per class, so each one is inspected only once.
+        The leading 'self' is dropped to match the bound method's signature.
+
+        Args:
+            name: Name of the indicator method
+
+        Returns:
+            Frozen set of parameter names (empty if the method does not exist)
+        """
+        method = getattr(Indicators, name, None)
+        if not callable(method):
+            return frozenset()
+        return frozenset(list(inspect.signature(method).parameters)[1:])
+
     def _get_expected_columns_dict(self, name: str, params: Dict[str, Any]) -> List[str]:
         """
         Wrapper for _get_expected_columns that accepts a dictionary.
@@ -165,7 +211,7 @@ class Analytic:
             return False
 
         # Filter only valid parameters for the method
-        method_params = inspect.signature(method).parameters
+        method_params = self._get_indicator_params(indicator_name)
         filtered_params = {k: v for k, v in params.items() if k in method_params}
         self.logger.info(f"Filtered parameters for {indicator_name}: {filtered_params}")
 
@@ -260,20 +306,29 @@ class Analytic:
         Returns:
             A unique cache key string
         """
-        # Create a dictionary with strategy class name and parameters
+        # Include the last modified timestamp of the data file to invalidate cache when data changes
+        data_timestamp = os.path.getmtime(self.output_path) if os.path.exists(self.output_path) else 0
+
+        try:
+            key_repr = repr((strategy_cls.__name__, self.data_name, _freeze(params), data_timestamp))
+        except TypeError:
+            # Non-primitive parameter values: fall back to hashing their JSON form
+            pass
+        else:
+            return blake2b(key_repr.encode(), digest_size=16).hexdigest()
+
         cache_dict = {
             "strategy_class": strategy_cls.__name__,
             "data_name": self.data_name,
             "params": params,
-            # Include the last modified timestamp of the data file to invalidate cache when data changes
-            "data_timestamp": os.path.getmtime(self.output_path) if os.path.exists(self.output_path) else 0
+            "data_timestamp": data_timestamp
         }
 
         # Convert to a stable JSON string (sort keys for consistency)
         cache_json = json.dumps(cache_dict, sort_keys=True)
 
-        # Create an MD5 hash of the JSON string
-        cache_hash = md5(cache_json.encode()).hexdigest()
+        # Create a 128-bit BLAKE2b hash of the JSON string
+        cache_hash = blake2b(cache_json.encode(), digest_size=16).hexdigest()
 
         return cache_hash
 
@@ -383,11 +438,11 @@ class Analytic:
 
                 # Calculate indicators for this batch
                 for indicator_name in indicators:
-                    params = stratparams.get(indicator_name, {})
+                    indicator_params = stratparams.get(indicator_name, {})
                     method = getattr(batch_indicators, indicator_name, None)
                     if method is not None:
-                        method_params = inspect.signature(method).parameters
-                        filtered_params = {k: v for k, v in params.items() if k in method_params}
+                        method_params = self._get_indicator_params(indicator_name)
+                        filtered_params = {k: v for k, v in indicator_params.items() if k in method_params}
                         try:
                             method(inplace=True, **filtered_params)
                         except Exception as e:
@@ -414,6 +469,7 @@ class Analytic:
 
         # Cache the result if caching is enabled
         if use_cache:
+            # Derived after the save so it matches the next lookup's data timestamp
             cache_key = self._generate_cache_key(strategy_cls, **params)
             self._cache_result(cache_key, result)
 
@@ -7,6 +7,7 @@ including initialization, running, and graceful shutdown of all components.
 
 import asyncio
 import logging
+import os
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -36,6 +37,7 @@ class Application:
         self.trading_engine: Optional[TradingEngine] = None
         self.api_client: Optional[Any] = None
         self.dashboard_process: Optional[Any] = None
+        self._dashboard_pidfd: Optional[int] = None
         
         # Application state
         self.is_running = False
@@ -209,20 +211,64 @@ class Application:
             self.logger.info(f"Dashboard available at {url}")
             
             if Config.DASHBOARD.AUTO_OPEN_BROWSER:
-                try:
-                    import webbrowser
-                    webbrowser.open_new_tab(url)
-                except Exception as e:
-                    self.logger.warning(f"Failed to open browser: {e}")
+                import webbrowser
+                # Launching the browser can block for a while; keep it off the event loop
+                future = asyncio.get_running_loop().run_in_executor(
+                    None, webbrowser.open_new_tab, url
+                )
+                future.add_done_callback(self._on_browser_opened)
             
             self.dashboard_process = raw_popen
             self.component_status['dashboard'] = 'running'
+            self._watch_dashboard_process(raw_popen)
             return raw_popen
             
         except Exception as e:
             self.logger.error(f"Failed to start dashboard: {e}")
             return None
     
+    def _on_browser_opened(self, future: "asyncio.Future") -> None:
+        """Log a failure to open the dashboard in the browser."""
+        if future.cancelled():
+            return
+        e = future.exception()
+        if e is not None:
+            self.logger.warning(f"Failed to open browser: {e}")
+    
+    def _watch_dashboard_process(self, proc: Any) -> None:
+        """
+        Get notified when the dashboard process exits.
+        
+        Uses a pidfd registered with the event loop (Linux, Python 3.9+), so the
+        exit is reported without polling. Elsewhere the status is left as is.
+        """
+        if not hasattr(os, 'pidfd_open'):
+            return
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError as e:
+            self.logger.debug(f"pidfd_open unavailable for dashboard process: {e}")
+            return
+        self._dashboard_pidfd = pidfd
+        asyncio.get_running_loop().add_reader(pidfd, self._on_dashboard_exit)
+    
+    def _unwatch_dashboard_process(self) -> None:
+        """Stop watching the dashboard process and release its pidfd."""
+        pidfd, self._dashboard_pidfd = self._dashboard_pidfd, None
+        if pidfd is None:
+            return
+        asyncio.get_running_loop().remove_reader(pidfd)
+        os.close(pidfd)
+    
+    def _on_dashboard_exit(self) -> None:
+        """Mark the dashboard as stopped once its process has exited."""
+        self._unwatch_dashboard_process()
+        returncode = self.dashboard_process.poll() if self.dashboard_process else None
+        self.logger.warning(f"Dashboard process exited with code {returncode}")
+        self.component_status['dashboard'] = 'stopped'
+        if self.dashboard_manager:
+            self.dashboard_manager.update_component_status('dashboard', 'stopped')
+    
     async def start_trading(self) -> None:
         """Start the trading engine."""
         if not self.trading_engine:
@@ -297,6 +343,7 @@ class Application:
         await asyncio.sleep(0.5)
         
         # Stop dashboard
+        self._unwatch_dashboard_process()
         if self.dashboard_process and Config.DASHBOARD.USE_FLASK:
             self.logger.info("Stopping dashboard")
             try:
@@ -7,9 +7,10 @@ This module loads configuration from environment variables and .env file.
 import os
 import sys
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Final, Mapping, Optional, Tuple, Union
 from pathlib import Path
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
 
 # --- Path setup ---
@@ -18,55 +19,120 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+_ENV_PATH: Final[Path] = project_root / '.env'
+
 
 # --- Environment Initialization ---
 # This block ensures environment is loaded before any config classes are defined.
+def _parse_env_file(path: Path) -> None:
+    """
+    Minimal .env parser: reads KEY=VALUE pairs into os.environ.
+    Blank lines and '#' comments are skipped, surrounding quotes are stripped,
+    and variables already present in the environment are not overridden.
+    """
+    for line in path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        os.environ.setdefault(key.strip(), value)
+
+
 def _initialize_environment():
     """
-    Loads environment variables from a .env file if python-dotenv is installed
-    and the file exists. This function is called once at the module level.
+    Loads environment variables from a .env file if the file exists.
+    This function is called once at the module level.
     """
     try:
-        from dotenv import load_dotenv
-        project_root = Path(__file__).parent.parent
-        env_path = project_root / '.env'
-        if env_path.exists():
-            load_dotenv(dotenv_path=env_path)
-            print(f"[Config] Loaded environment variables from {env_path}")
-        else:
-            print(f"[Config] .env file not found at {env_path}. Using OS environment variables only.")
-    except ImportError:
-        print("[Config] python-dotenv not installed. Using OS environment variables only.")
+        _parse_env_file(_ENV_PATH)
+        print(f"[Config] Loaded environment variables from {_ENV_PATH}")
+    except FileNotFoundError:
+        print(f"[Config] .env file not found at {_ENV_PATH}. Using OS environment variables only.")
 
 _initialize_environment()
 
+# Snapshot of the environment taken once after .env is applied; config sections
+# read from this plain dict instead of going through os.environ on every lookup.
+_ENV: Dict[str, str] = dict(os.environ)
+
 
 # --- Helper Functions ---
+_TRUE = frozenset({'true', 'yes', '1', 'on'})
+
 def _parse_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
-    return str(value).lower() in ('true', 'yes', '1', 'on')
+    return str(value).lower() in _TRUE
+
+def _getenv_bool(key: str, default: bool) -> bool:
+    value = _ENV.get(key)
+    return default if value is None else _parse_bool(value)
+
+def _getenv_int(key: str, default: int) -> int:
+    value = _ENV.get(key)
+    return default if value is None else int(value)
 
-def _get_env_list(key: str, default: str = ""):
-    """Parses a comma-separated string from environment variables into a list of strings."""
-    value = os.getenv(key, default)
+def _getenv_float(key: str, default: float) -> float:
+    value = _ENV.get(key)
+    return default if value is None else float(value)
+
+def _get_env_list(key: str, default: str = "") -> Tuple[str, ...]:
+    """Parses a comma-separated string from environment variables into a tuple of interned strings."""
+    value = _ENV.get(key, default)
     if not value:
-        return []
-    return [item.strip().upper() for item in value.split(',') if item.strip()]
+        return ()
+    return tuple(sys.intern(item) for item in (raw.strip().upper() for raw in value.split(',')) if item)
+
+def _apply_env(obj: Any, spec: Tuple[Tuple[str, str, Callable[[str], Any]], ...]) -> None:
+    """Override defaults only for the variables actually present in the environment."""
+    for attr, key, convert in spec:
+        value = _ENV.get(key)
+        if value is not None:
+            setattr(obj, attr, convert(value))
+
+@lru_cache(maxsize=8)
+def _symbol_name(symbol: str) -> str:
+    """Symbol without the slash, e.g. 'BTC/USDT' -> 'BTCUSDT'."""
+    return symbol.replace("/", "")
+
+@lru_cache(maxsize=8)
+def _csv_paths(symbol: str, timeframe: str) -> Mapping[str, str]:
+    """Read-only CSV path mapping shared by every caller with the same symbol and timeframe."""
+    symbol_name = _symbol_name(symbol)
+    return MappingProxyType({
+        'raw': f"DATA/{symbol_name}_{timeframe}.csv",
+        'anal': f"DATA/{symbol_name}_{timeframe}_anal.csv",
+    })
 
 
 # --- Configuration Classes ---
 
+# Веса стратегий по умолчанию: общий неизменяемый экземпляр, копируйте через dict(...) для изменения
+_DEFAULT_STRATEGY_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "RSI": 0.20, "XGB": 0.30, "MACD": 0.20, "BOLLINGER": 0.12,
+    "STOCHASTIC": 0.10, "WILLIAMS_R": 0.08
+})
+
 class APIConfig:
     """API configuration settings, loaded from environment variables."""
+    __slots__ = (
+        'USE_MOCK_API', 'USE_BYBIT_API', 'USE_COINBASE_API', 'USE_BINANCE_API',
+        'API_KEY', 'API_SECRET', 'TESTNET',
+    )
+
     def __init__(self):
-        self.USE_MOCK_API: bool = _parse_bool(os.getenv('USE_MOCK_API', 'False'))
-        self.USE_BYBIT_API: bool = _parse_bool(os.getenv('USE_BYBIT_API', 'False'))
-        self.USE_COINBASE_API: bool = _parse_bool(os.getenv('USE_COINBASE_API', 'False'))
-        self.USE_BINANCE_API: bool = _parse_bool(os.getenv('USE_BINANCE_API', 'False'))
-        self.API_KEY: str | None = os.getenv('API_KEY')
-        self.API_SECRET: str | None = os.getenv('API_SECRET')
-        self.TESTNET: bool = _parse_bool(os.getenv('TESTNET', 'True'))
+        self.USE_MOCK_API: bool = _getenv_bool('USE_MOCK_API', False)
+        self.USE_BYBIT_API: bool = _getenv_bool('USE_BYBIT_API', False)
+        self.USE_COINBASE_API: bool = _getenv_bool('USE_COINBASE_API', False)
+        self.USE_BINANCE_API: bool = _getenv_bool('USE_BINANCE_API', False)
+        self.API_KEY: str | None = _ENV.get('API_KEY')
+        self.API_SECRET: str | None = _ENV.get('API_SECRET')
+        self.TESTNET: bool = _getenv_bool('TESTNET', True)
 
         self._validate()
 
@@ -88,51 +154,51 @@ class TradingConfig:
     Loads active strategies and their weights from environment variables.
     Strategy parameters are managed by the STRATEGY_REGISTRY.
     """
+    __slots__ = (
+        'SYMBOL', 'TIMEFRAME', 'UPDATE_INTERVAL', 'MIN_QUANTITY', 'DEFAULT_ORDER_TYPE',
+        'LEVERAGE', 'TRADE_FEE', 'SLIPPAGE', 'STRATEGY_WEIGHTS', 'STRATEGIES', 'TARGET_FRACTION',
+    )
+
     def __init__(self):
-        self.SYMBOL: str = os.getenv("TRADING_SYMBOL", "BTC/USDT")
-        self.TIMEFRAME: str = os.getenv("TRADING_TIMEFRAME", "1m")
-        self.UPDATE_INTERVAL: int = int(os.getenv("UPDATE_INTERVAL", 10))
-        self.MIN_QUANTITY: float = float(os.getenv("MIN_QUANTITY", 0.0001))
-        self.DEFAULT_ORDER_TYPE: str = os.getenv("DEFAULT_ORDER_TYPE", "market")
-        self.LEVERAGE: int = int(os.getenv("LEVERAGE", 1))
-        self.TRADE_FEE: float = float(os.getenv("TRADE_FEE", 0.00075))
-        self.SLIPPAGE: float = float(os.getenv("SLIPPAGE", 0.001))
+        # Интернируем строки, которые часто сравниваются и используются как ключи
+        self.SYMBOL: str = sys.intern(_ENV.get("TRADING_SYMBOL", "BTC/USDT"))
+        self.TIMEFRAME: str = sys.intern(_ENV.get("TRADING_TIMEFRAME", "1m"))
+        self.UPDATE_INTERVAL: int = _getenv_int("UPDATE_INTERVAL", 10)
+        self.MIN_QUANTITY: float = _getenv_float("MIN_QUANTITY", 0.0001)
+        self.DEFAULT_ORDER_TYPE: str = _ENV.get("DEFAULT_ORDER_TYPE", "market")
+        self.LEVERAGE: int = _getenv_int("LEVERAGE", 1)
+        self.TRADE_FEE: float = _getenv_float("TRADE_FEE", 0.00075)
+        self.SLIPPAGE: float = _getenv_float("SLIPPAGE", 0.001)
         
         # Загрузка стратегий и их весов из одной переменной .env
-        self.STRATEGY_WEIGHTS: Dict[str, float] = self._load_strategy_config()
+        self.STRATEGY_WEIGHTS: Mapping[str, float] = self._load_strategy_config()
 
         # Если в .env ничего не найдено, используются значения по умолчанию
         if not self.STRATEGY_WEIGHTS:
             print("[Config] Warning: STRATEGY_CONFIG не найден в .env. Используются стратегии и веса по умолчанию.")
-            self.STRATEGY_WEIGHTS = {
-                "RSI": 0.20, "XGB": 0.30, "MACD": 0.20, "BOLLINGER": 0.12,
-                "STOCHASTIC": 0.10, "WILLIAMS_R": 0.08
-            }
+            self.STRATEGY_WEIGHTS = _DEFAULT_STRATEGY_WEIGHTS
         
         self.STRATEGIES: List[str] = list(self.STRATEGY_WEIGHTS.keys())
-        self.TARGET_FRACTION: float = float(os.getenv("TARGET_FRACTION", 0.01))
+        self.TARGET_FRACTION: float = _getenv_float("TARGET_FRACTION", 0.01)
         
         print(f"[Config] Загруженные стратегии: {self.STRATEGIES}")
         print(f"[Config] Загруженные веса: {self.STRATEGY_WEIGHTS}")
 
-    def get_csv_paths(self) -> Dict[str, str]:
+    def get_csv_paths(self) -> Mapping[str, str]:
         """Get CSV file paths for different data types."""
-        symbol_name = self.get_symbol_name()
-        return {
-            'raw': f"DATA/{symbol_name}_{self.TIMEFRAME}.csv",
-            'anal': f"DATA/{symbol_name}_{self.TIMEFRAME}_anal.csv",
-        }
+        return _csv_paths(self.SYMBOL, self.TIMEFRAME)
 
     def get_symbol_name(self) -> str:
         """Get symbol name without slash."""
-        return self.SYMBOL.replace("/", "")    
+        return _symbol_name(self.SYMBOL)
+
     def _load_strategy_config(self) -> Dict[str, float]:
         """
         Загружает конфигурацию стратегий из переменной окружения STRATEGY_CONFIG.
         Формат: "RSI:0.3,MACD:0.7".
         """
         from STRATEGY import STRATEGY_REGISTRY
-        config_str = os.getenv("STRATEGY_CONFIG")
+        config_str = _ENV.get("STRATEGY_CONFIG")
         if not config_str:
             return {}
             
@@ -152,7 +218,7 @@ class TradingConfig:
                     print(f"[Config] Warning: Неверный вес для стратегии '{name}'. Она будет проигнорирована.")
         return weights
 
-@dataclass
+@dataclass(slots=True)
 class DashboardConfig:
     """Dashboard configuration settings."""
     
@@ -168,12 +234,17 @@ class DashboardConfig:
     # Timeouts
     PORT_WAIT_TIMEOUT: int = field(default=10)
     
+    # (attribute, environment variable, converter)
+    _ENV_SPEC = (
+        ('HOST', 'DASHBOARD_HOST', sys.intern),
+        ('PORT', 'DASHBOARD_PORT', int),
+        ('USE_FLASK', 'USE_FLASK', _parse_bool),
+        ('USE_PLOT', 'USE_PLOT', _parse_bool),
+    )
+    
     def __post_init__(self):
         """Load values from environment variables after initialization."""
-        self.HOST = os.getenv('DASHBOARD_HOST', self.HOST)
-        self.PORT = int(os.getenv('DASHBOARD_PORT', str(self.PORT)))
-        self.USE_FLASK = _parse_bool(os.getenv('USE_FLASK', str(self.USE_FLASK)))
-        self.USE_PLOT = _parse_bool(os.getenv('USE_PLOT', str(self.USE_PLOT)))
+        _apply_env(self, self._ENV_SPEC)
         
         print(f"[DEBUG] DashboardConfig - USE_FLASK: {self.USE_FLASK}, USE_PLOT: {self.USE_PLOT}")
     
@@ -184,7 +255,7 @@ class DashboardConfig:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration settings."""
     
@@ -202,14 +273,17 @@ class LoggingConfig:
     # State File
     STATE_PATH: str = field(default="DATA/static/state.json")
     
+    # (attribute, environment variable, converter)
+    _ENV_SPEC = (
+        ('CLEAN_LOGS_MAX_AGE_HOURS', 'CLEAN_LOGS_MAX_AGE_HOURS', int),
+    )
+    
     def __post_init__(self):
         """Load values from environment variables after initialization."""
-        self.CLEAN_LOGS_MAX_AGE_HOURS = int(
-            os.getenv('CLEAN_LOGS_MAX_AGE_HOURS', str(self.CLEAN_LOGS_MAX_AGE_HOURS))
-        )
+        _apply_env(self, self._ENV_SPEC)
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceConfig:
     """Performance monitoring configuration settings."""
     
@@ -228,46 +302,110 @@ class PerformanceConfig:
     ALERT_EMAIL: Optional[str] = field(default=None)
     ALERT_WEBHOOK: Optional[str] = field(default=None)
     
+    # (attribute, environment variable, converter)
+    _ENV_SPEC = (
+        ('ENABLE_ALERTS', 'ENABLE_ALERTS', _parse_bool),
+        ('ALERT_EMAIL', 'ALERT_EMAIL', str),
+        ('ALERT_WEBHOOK', 'ALERT_WEBHOOK', str),
+    )
+    
     def __post_init__(self):
         """Load values from environment variables after initialization."""
-        self.ENABLE_ALERTS = self._parse_bool(os.getenv('ENABLE_ALERTS', str(self.ENABLE_ALERTS)))
-        self.ALERT_EMAIL = os.getenv('ALERT_EMAIL', self.ALERT_EMAIL)
-        self.ALERT_WEBHOOK = os.getenv('ALERT_WEBHOOK', self.ALERT_WEBHOOK)
+        _apply_env(self, self._ENV_SPEC)
+
+
+# Field names of each section, computed once for Config.to_dict()
+_API_FIELDS: Tuple[str, ...] = APIConfig.__slots__
+_TRADING_FIELDS: Tuple[str, ...] = TradingConfig.__slots__
+_DASHBOARD_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(DashboardConfig))
+_LOGGING_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(LoggingConfig))
+
+def _section_dict(section: Any, field_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Snapshot a config section as a plain dict."""
+    snapshot = {}
+    for name in field_names:
+        value = getattr(section, name)
+        # Read-only defaults (MappingProxyType) are copied so the result stays JSON-serializable
+        snapshot[name] = dict(value) if isinstance(value, Mapping) else value
+    return snapshot
+
+
+class _EnsuredDirs(dict):
+    """Maps a directory path to itself, creating the directory on the first lookup."""
+    def __missing__(self, path: str) -> str:
+        os.makedirs(path, exist_ok=True)
+        self[path] = path
+        return path
+
+_ENSURED_DIRS = _EnsuredDirs()
+
+
+class _LazySection:
+    """
+    Descriptor that builds a configuration section on first access.
+    The instance is then stored in the owner's __dict__, so later reads
+    bypass the descriptor entirely.
+    """
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        # Non-data descriptor: once the section is in __dict__, attribute lookup
+        # finds it there first, so reaching this point always means a miss.
+        value = instance.__dict__[self.name] = self.factory()
+        return value
 
 
 @dataclass
 class Config:
     """
     Unified configuration provider.
-    Loads all settings from the environment during initialization.
+    Sections are loaded from the environment on first access.
     """
-    def __init__(self):
-        self.API = APIConfig()
-        self.TRADING = TradingConfig()
-        self.DASHBOARD = DashboardConfig()
-        self.LOGGING = LoggingConfig()
-        
-        # Static directories
-        self.DATA_DIR = "DATA"
-        self.LOGS_DIR = "LOGS"
-        self.STATIC_DIR = "DATA/static"
-        
-        self.ensure_directories()
+    API = _LazySection(APIConfig)
+    TRADING = _LazySection(TradingConfig)
+    DASHBOARD = _LazySection(DashboardConfig)
+    LOGGING = _LazySection(LoggingConfig)
+
+    # Static directories, created on first access
+    @property
+    def DATA_DIR(self) -> str:
+        return _ENSURED_DIRS["DATA"]
+
+    @property
+    def LOGS_DIR(self) -> str:
+        return _ENSURED_DIRS["LOGS"]
+
+    @property
+    def STATIC_DIR(self) -> str:
+        return _ENSURED_DIRS["DATA/static"]
+
+    def reload_env(self) -> None:
+        """Re-snapshot os.environ and drop built sections so they are reloaded on next access."""
+        _ENV.clear()
+        _ENV.update(os.environ)
+        for name in ('API', 'TRADING', 'DASHBOARD', 'LOGGING'):
+            self.__dict__.pop(name, None)
 
     def ensure_directories(self):
         """Create necessary directories if they don't exist."""
-        os.makedirs(self.DATA_DIR, exist_ok=True)
-        os.makedirs(self.LOGS_DIR, exist_ok=True)
-        os.makedirs(self.STATIC_DIR, exist_ok=True)
+        for path in ("DATA", "LOGS", "DATA/static"):
+            _ENSURED_DIRS[path]  # lookup creates the directory on first use
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return {
-            'API': self.API.__dict__,
-            'TRADING': self.TRADING.__dict__,
-            'DASHBOARD': self.DASHBOARD.__dict__,
-            'LOGGING': self.LOGGING.__dict__,
-            # 'PERFORMANCE': self.PERFORMANCE.__dict__,
+            'API': _section_dict(self.API, _API_FIELDS),
+            'TRADING': _section_dict(self.TRADING, _TRADING_FIELDS),
+            'DASHBOARD': _section_dict(self.DASHBOARD, _DASHBOARD_FIELDS),
+            'LOGGING': _section_dict(self.LOGGING, _LOGGING_FIELDS),
+            # 'PERFORMANCE': _section_dict(self.PERFORMANCE, ...),
             'DATA_DIR': self.DATA_DIR,
             'LOGS_DIR': self.LOGS_DIR,
             'STATIC_DIR': self.STATIC_DIR,
@@ -279,18 +417,15 @@ class Config:
 
 
 # --- Global Singleton Instance ---
-# This ensures the configuration is loaded only once.
-_config_instance = None
+# Built once at import time; sections themselves are loaded lazily.
+_CONFIG_SINGLETON: Final[Config] = Config()
 
-def get_config():
-    """Initializes and returns the global Config instance."""
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config()
-    return _config_instance
+def get_config() -> Config:
+    """Returns the global Config instance."""
+    return _CONFIG_SINGLETON
 
 # Create the global instance that the rest of the application will use
-Config = get_config()
+Config = _CONFIG_SINGLETON
 
 if __name__=="__main__":
     print(Config)
\ No newline at end of file
@@ -6,16 +6,101 @@ state management, data updates, and dashboard communication.
 """
 
 import asyncio
+import atexit
 import json
 import logging
 import os
+import random
 import time
-from datetime import datetime, timedelta
+import weakref
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional, List
-import pandas as pd
 
 from .config import Config
 
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if _has_orjson else 0
+)
+
+# On Windows os.replace fails while another process (the Flask dashboard)
+# has the target open, so the rename is retried briefly.
+_REPLACE_RETRIES = 5
+_REPLACE_RETRY_DELAY = 0.01  # seconds
+
+
+def _replace_with_retry(tmp_path: str, path: str, payload: bytes) -> None:
+    """Rename tmp_path over path, writing in place on Windows if it stays locked."""
+    for _ in range(_REPLACE_RETRIES - 1):
+        try:
+            os.replace(tmp_path, path)
+            return
+        except PermissionError:
+            time.sleep(_REPLACE_RETRY_DELAY)
+    try:
+        os.replace(tmp_path, path)
+    except PermissionError:
+        if os.name != 'nt':
+            raise
+        # The reader still holds the file: fall back to a non-atomic write
+        with open(path, 'wb') as f:
+            f.write(payload)
+        os.remove(tmp_path)
+
+
+def _write_bytes_atomic(path: str, payload: bytes) -> None:
+    """
+    Write payload to path via a temporary file and os.replace.
+    
+    Readers never observe a partially written file and a crash mid-write
+    leaves the previous state intact. The parent directory is only created
+    if the first attempt finds it missing.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            f = open(tmp_path, 'wb')
+        with f:
+            f.write(payload)
+        _replace_with_retry(tmp_path, path, payload)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]) -> None:
+    """Serialize data to JSON and write it atomically to path."""
+    if _has_orjson:
+        payload = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    _write_bytes_atomic(path, payload)
+
+
+# Managers whose pending updates are flushed when the interpreter exits
+_live_managers: "weakref.WeakSet[DashboardManager]" = weakref.WeakSet()
+
+
+def _flush_live_managers() -> None:
+    """Persist updates still pending in any live DashboardManager."""
+    for manager in list(_live_managers):
+        manager._flush_pending()
+
+
+atexit.register(_flush_live_managers)
+
 
 class DashboardManager:
     """
@@ -28,6 +113,20 @@ class DashboardManager:
     - State persistence
     """
     
+    # Backoff between port probes in _wait_for_port
+    PORT_PROBE_INITIAL_DELAY = 0.01  # seconds
+    PORT_PROBE_MAX_DELAY = 0.25  # seconds
+    PORT_PROBE_MULTIPLIER = 1.5
+    PORT_PROBE_JITTER = 0.2  # +/- fraction of the current delay
+    
+    # Window during which state updates are coalesced into a single write
+    SAVE_BATCH_WINDOW = 0.005  # seconds
+    
+    # Without the flusher, write after this many updates or at most this long
+    # after the first unsaved one
+    SAVE_EVERY_N_UPDATES = 32
+    SAVE_MAX_INTERVAL = 1.0  # seconds
+    
     def __init__(self):
         """Initialize the DashboardManager."""
         self.logger = logging.getLogger(__name__)
@@ -40,12 +139,22 @@ class DashboardManager:
         self.last_update = None
         self.update_interval = 1.0  # seconds
         
+        # Deferred state persistence (active between start() and stop())
+        self._dirty_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending_updates = 0
+        self._last_flush = time.monotonic()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        
         # Ensure state directory exists
         os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
         
         # Load initial state
         self._load_state()
         
+        # Persist updates still pending when the interpreter exits
+        _live_managers.add(self)
+        
         self.logger.info(f"DashboardManager initialized for {self.host}:{self.port}")
     
     def _load_state(self) -> None:
@@ -94,13 +203,65 @@ class DashboardManager:
     
     def _save_state(self) -> None:
         """Save dashboard state to file."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         try:
             self.state['last_update'] = datetime.now().isoformat()
-            with open(self.state_path, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2, ensure_ascii=False, default=str)
+            _write_json_atomic(self.state_path, self.state)
+            self._pending_updates = 0
+            self._last_flush = time.monotonic()
         except Exception as e:
             self.logger.error(f"Failed to save dashboard state: {e}")
     
+    def _mark_dirty(self) -> None:
+        """
+        Schedule a state write.
+        
+        While the flusher runs it picks the change up. Otherwise the state is
+        written once SAVE_EVERY_N_UPDATES updates are pending or
+        SAVE_MAX_INTERVAL has passed since the last write; a deferred write is
+        completed by a timer on the running loop, or done immediately if no
+        loop is running.
+        """
+        self._pending_updates += 1
+        if self._flush_task is not None and not self._flush_task.done():
+            self._dirty_event.set()
+            return
+        elapsed = time.monotonic() - self._last_flush
+        if (self._pending_updates >= self.SAVE_EVERY_N_UPDATES
+                or elapsed >= self.SAVE_MAX_INTERVAL):
+            self._save_state()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Nothing could complete a deferred write later
+            self._save_state()
+            return
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.SAVE_MAX_INTERVAL - elapsed, self._on_flush_timer
+            )
+    
+    def _on_flush_timer(self) -> None:
+        """Write updates deferred by _mark_dirty."""
+        self._flush_handle = None
+        self._flush_pending()
+    
+    def _flush_pending(self) -> None:
+        """Write the state if there are updates not yet persisted."""
+        if self._pending_updates:
+            self._save_state()
+    
+    async def _flush_loop(self) -> None:
+        """Persist state once per batch of updates."""
+        while True:
+            await self._dirty_event.wait()
+            self._dirty_event.clear()
+            await asyncio.sleep(self.SAVE_BATCH_WINDOW)
+            self._save_state()
+    
     def update_component_status(self, component: str, status: str) -> None:
         """
         Update the status of a component.
@@ -113,9 +274,9 @@ class DashboardManager:
             self.state['components'] = {}
         
         self.state['components'][component] = status
-        self._save_state()
+        self._mark_dirty()
         
-        self.logger.debug(f"Updated component {component} status to {status}")
+        self.logger.debug("Updated component %s status to %s", component, status)
     
     def update_trading_info(self, trading_info: Dict[str, Any]) -> None:
         """
@@ -128,7 +289,7 @@ class DashboardManager:
             self.state['trading'] = {}
         
         self.state['trading'].update(trading_info)
-        self._save_state()
+        self._mark_dirty()
         
         self.logger.debug("Updated trading information")
     
@@ -143,7 +304,7 @@ class DashboardManager:
             self.state['performance'] = {}
         
         self.state['performance'].update(performance_info)
-        self._save_state()
+        self._mark_dirty()
         
         self.logger.debug("Updated performance information")
     
@@ -163,50 +324,67 @@ class DashboardManager:
         Returns:
             True if port is available, False otherwise
         """
-        start_time = time.time()
+        monotonic = asyncio.get_running_loop().time
+        deadline = monotonic() + timeout
+        delay = self.PORT_PROBE_INITIAL_DELAY
         
-        while time.time() - start_time < timeout:
+        while (remaining := deadline - monotonic()) > 0:
             try:
                 reader, writer = await asyncio.wait_for(
                     asyncio.open_connection(host, port),
-                    timeout=1.0
+                    timeout=min(0.5, remaining)
                 )
                 writer.close()
                 await writer.wait_closed()
                 return True
             except (asyncio.TimeoutError, ConnectionRefusedError, OSError):
-                await asyncio.sleep(0.1)
+                jitter = random.uniform(-self.PORT_PROBE_JITTER, self.PORT_PROBE_JITTER) * delay
+                await asyncio.sleep(max(0.0, delay + jitter))
+                delay = min(delay * self.PORT_PROBE_MULTIPLIER, self.PORT_PROBE_MAX_DELAY)
         
         return False
     
     async def start(self) -> None:
         """Start the dashboard manager."""
         self.logger.info("Starting dashboard manager")
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
         self.update_component_status('dashboard', 'running')
     
     async def stop(self) -> None:
         """Stop the dashboard manager."""
         self.logger.info("Stopping dashboard manager")
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
         self.update_component_status('dashboard', 'stopped')
-        self._save_state()
+        self._flush_pending()
+        _live_managers.discard(self)
     
     def is_running(self) -> bool:
         """Check if dashboard manager is running."""
         return self.state.get('components', {}).get('dashboard') == 'running'
 
 
-# Fallback function for writing state
-def write_state_fallback(state: Dict[str, Any], state_path: str) -> None:
+# Fallback state written when the API client cannot report its own state.
+# Everything but the timestamp is constant, so it is encoded once.
+_FALLBACK_PREFIX = b'{"balance":{"total":null,"currency":"USDT"},"positions":[],"updated":"'
+_FALLBACK_SUFFIX = b'"}'
+
+
+async def write_state_fallback(state_path: str) -> None:
     """
-    Fallback function for writing state when dashboard manager is not available.
+    Fallback function for writing state when the API client cannot update it.
     
     Args:
-        state: State to write
         state_path: Path to write state to
     """
     try:
-        os.makedirs(os.path.dirname(state_path), exist_ok=True)
-        with open(state_path, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False, default=str)
+        updated = datetime.now(timezone.utc).isoformat().encode('ascii')
+        _write_bytes_atomic(state_path, _FALLBACK_PREFIX + updated + _FALLBACK_SUFFIX)
     except Exception as e:
         logging.error(f"Failed to write state fallback: {e}")
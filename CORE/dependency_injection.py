@@ -5,9 +5,13 @@ This module provides a simple dependency injection container
 that manages component dependencies and their lifecycle.
 """
 
-from typing import Dict, Any, Optional, Type, Callable
+from typing import Dict, Any, Optional, Type, Callable, Tuple
 from abc import ABC, abstractmethod
 
+# Registry entry kinds
+_SINGLETON = 0
+_FACTORY = 1
+
 
 class ServiceProvider(ABC):
     """Abstract base class for service providers."""
@@ -33,9 +37,8 @@ class DependencyContainer(ServiceProvider):
     
     def __init__(self):
         """Initialize the dependency container."""
-        self._services: Dict[Type, Any] = {}
-        self._factories: Dict[Type, Callable[[], Any]] = {}
-        self._singletons: Dict[Type, Any] = {}
+        # service_type -> (kind, singleton instance or factory)
+        self._registry: Dict[Type, Tuple[int, Any]] = {}
     
     def register_service(self, service_type: Type, factory: Callable[[], Any]) -> None:
         """
@@ -45,7 +48,10 @@ class DependencyContainer(ServiceProvider):
             service_type: The type of service to register
             factory: Factory function that creates the service
         """
-        self._factories[service_type] = factory
+        # A registered singleton keeps precedence over a factory
+        entry = self._registry.get(service_type)
+        if entry is None or entry[0] != _SINGLETON:
+            self._registry[service_type] = (_FACTORY, factory)
     
     def register_singleton(self, service_type: Type, instance: Any) -> None:
         """
@@ -55,7 +61,7 @@ class DependencyContainer(ServiceProvider):
             service_type: The type of service to register
             instance: The service instance
         """
-        self._singletons[service_type] = instance
+        self._registry[service_type] = (_SINGLETON, instance)
     
     def get_service(self, service_type: Type) -> Any:
         """
@@ -70,21 +76,15 @@ class DependencyContainer(ServiceProvider):
         Raises:
             KeyError: If service type is not registered
         """
-        # Check if it's a singleton
-        if service_type in self._singletons:
-            return self._singletons[service_type]
-        
-        # Check if we have a factory
-        if service_type in self._factories:
-            # Create new instance
-            instance = self._factories[service_type]()
-            return instance
-        
-        # Check if we have a concrete instance
-        if service_type in self._services:
-            return self._services[service_type]
+        entry = self._registry.get(service_type)
+        if entry is None:
+            raise KeyError(f"Service type {service_type.__name__} is not registered")
         
-        raise KeyError(f"Service type {service_type.__name__} is not registered")
+        kind, payload = entry
+        if kind == _SINGLETON:
+            return payload
+        # Factory: create new instance
+        return payload()
     
     def has_service(self, service_type: Type) -> bool:
         """
@@ -96,15 +96,11 @@ class DependencyContainer(ServiceProvider):
         Returns:
             True if service is registered, False otherwise
         """
-        return (service_type in self._factories or 
-                service_type in self._singletons or 
-                service_type in self._services)
+        return service_type in self._registry
     
     def clear(self) -> None:
         """Clear all registered services and factories."""
-        self._services.clear()
-        self._factories.clear()
-        self._singletons.clear()
+        self._registry.clear()
 
 
 # Global dependency container instance
@@ -19,6 +19,9 @@ import re
 # Import configuration
 from .config import Config
 
+# Logger name -> (tag, logfile, console) it was last configured with
+_configured_loggers: Dict[str, Tuple[str, str, bool]] = {}
+
 
 class Logger:
     """
@@ -41,9 +44,16 @@ class Logger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.INFO)
 
+        # Same configuration as last time: reuse the existing handlers
+        config = (tag, logfile, console)
+        if _configured_loggers.get(name) == config and self.logger.handlers:
+            return
+
         formatter = logging.Formatter(f"%(asctime)s {tag} [%(levelname)s] %(message)s")
 
         if self.logger.hasHandlers():
+            for handler in self.logger.handlers:
+                handler.close()
             self.logger.handlers.clear()
 
         general_log = "LOGS/general.log"
@@ -66,6 +76,8 @@ class Logger:
             stream_handler.setFormatter(formatter)
             self.logger.addHandler(stream_handler)
 
+        _configured_loggers[name] = config
+
     def get_logger(self):
         """Get the configured logger instance."""
         return self.logger